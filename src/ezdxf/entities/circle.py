@@ -2,7 +2,7 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Iterable
-
+import math
 from ezdxf.math import Vector, UCS, OCS, Z_AXIS
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
@@ -59,10 +59,15 @@ class Circle(DXFGraphic):
 
         """
         ocs = self.ocs()
-        for angle in angles:
-            v = Vector.from_deg_angle(angle, self.dxf.radius) + self.dxf.center
-            # convert from OCS to WCS
-            yield ocs.to_wcs(v)
+        radius = self.dxf.radius
+        cx, cy, cz = Vector(self.dxf.center)
+        # bind math functions to local names, faster lookup in the loop
+        cos = math.cos
+        sin = math.sin
+        radians = math.radians
+        vertices = (Vector(cx + cos(angle) * radius, cy + sin(angle) * radius, cz) for angle in map(radians, angles))
+        # convert from OCS to WCS
+        yield from ocs.points_to_wcs(vertices)
 
     def transform_to_wcs(self, ucs: 'UCS') -> 'Circle':
         """ Transform CIRCLE from local :class:`~ezdxf.math.UCS` coordinates to :ref:`WCS` coordinates.
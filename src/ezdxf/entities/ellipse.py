@@ -75,15 +75,22 @@ class Ellipse(DXFGraphic):
         # point on ellipse calculation
         radius_x = major_axis.magnitude
         radius_y = radius_x * self.dxf.ratio
-        center = Vector(self.dxf.center)
+
+        # scale axis by radius once and unpack all loop invariant values into floats, this avoids the creation of
+        # four temporary Vector() objects for each vertex
+        xx, xy, xz = x_axis * radius_x
+        yx, yy, yz = y_axis * radius_y
+        cx, cy, cz = Vector(self.dxf.center)
+        cos = math.cos
+        sin = math.sin
         for param in params:
             # Ellipse params in radians by definition (DXF Reference)
-            x = math.cos(param) * radius_x
-            y = math.sin(param) * radius_y
+            c = cos(param)
+            s = sin(param)
 
             # construct WCS coordinates, do not convert from OCS to WCS, extrusion defines only the normal vector of
             # the ellipse plane.
-            yield center + (x_axis * x) + (y_axis * y)
+            yield Vector(cx + xx * c + yx * s, cy + xy * c + yy * s, cz + xz * c + yz * s)
 
     @property
     def start_point(self) -> 'Vector':
@@ -9,6 +9,7 @@ from .construct2d import (
 )
 from .construct3d import (
     is_planar_face, subdivide_face, Plane, LocationState, intersection_ray_ray_3d, normal_vector_3p,
+    distance_point_line_segment_3d,
 )
 from .matrix44 import Matrix44
 from .matrix33 import Matrix33
@@ -2,7 +2,8 @@
 # Created: 26.03.2010
 # Copyright (c) 2010-2018 Manfred Moitzi
 # License: MIT License
-from typing import List, TYPE_CHECKING, Iterable, Sequence
+from typing import List, TYPE_CHECKING, Iterable, Sequence, Tuple
+from functools import lru_cache
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
@@ -80,11 +81,23 @@ class Bezier4P:
             iterable of ``(x, y[, z])`` tuples
 
         """
-        delta_t = 1. / segments
-        yield self._cpoints[0]
-        for segment in range(1, segments):
-            yield self.point(delta_t * segment)
-        yield self._cpoints[3]
+        # bind control point components to local names, t is always in range, no need for range checks and
+        # vector helper calls for each vertex
+        if self.math is D3D:
+            (x1, y1, z1), (x2, y2, z2), (x3, y3, z3), (x4, y4, z4) = self._cpoints
+            for f1, f2, f3, f4 in bernstein_basis(segments):
+                yield (
+                    x1 * f1 + x2 * f2 + x3 * f3 + x4 * f4,
+                    y1 * f1 + y2 * f2 + y3 * f3 + y4 * f4,
+                    z1 * f1 + z2 * f2 + z3 * f3 + z4 * f4,
+                )
+        else:
+            (x1, y1), (x2, y2), (x3, y3), (x4, y4) = self._cpoints
+            for f1, f2, f3, f4 in bernstein_basis(segments):
+                yield (
+                    x1 * f1 + x2 * f2 + x3 * f3 + x4 * f4,
+                    y1 * f1 + y2 * f2 + y3 * f3 + y4 * f4,
+                )
 
     def _get_curve_point(self, t: float) -> 'Vertex':
         b1, b2, b3, b4 = self._cpoints
@@ -117,6 +130,39 @@ class Bezier4P:
         return length
 
 
+MAX_CACHED_BASIS_COUNT = 64
+
+
+def bernstein_basis(count: int) -> Iterable[Tuple[float, float, float, float]]:
+    """
+    Returns the cubic Bernstein basis values for `count` + 1 uniform parameters t from 0 to 1. The basis depends only
+    on the segment count, therefore it is calculated once and shared by all curves with the same segment count, but
+    only for counts up to `MAX_CACHED_BASIS_COUNT`, basis values for bigger counts are calculated on the fly to
+    keep the memory usage constant.
+
+    """
+    if count <= MAX_CACHED_BASIS_COUNT:
+        return _cached_bernstein_basis(count)
+    return _bernstein_basis(count)
+
+
+@lru_cache(maxsize=MAX_CACHED_BASIS_COUNT)
+def _cached_bernstein_basis(count: int) -> Tuple[Tuple[float, float, float, float], ...]:
+    return tuple(_bernstein_basis(count))
+
+
+def _bernstein_basis(count: int) -> Iterable[Tuple[float, float, float, float]]:
+    for index in range(count + 1):
+        t = index / count
+        one_minus_t = 1. - t
+        yield (
+            one_minus_t ** 3,
+            3. * one_minus_t ** 2 * t,
+            3. * one_minus_t * t ** 2,
+            t ** 3,
+        )
+
+
 class D2D:
     @staticmethod
     def vadd(vector1: 'Vertex', vector2: 'Vertex') -> 'Vertex':
@@ -599,9 +599,15 @@ class Basis:
     def basis(self, t: float) -> List[float]:
         knots = self.knots
         nbasis = self.create_nbasis(t)
-        # calculate the higher order basis functions
+        nplusc = self.nplusc
+        try:
+            span = nbasis.index(1.)
+        except ValueError:  # t outside of knot range
+            span = -1
+        # calculate the higher order basis functions, only the basis functions N[span-k+1] to N[span] of order k are
+        # not 0, all other basis functions remain 0 (local support)
         for k in range(2, self.order + 1):
-            for i in range(self.nplusc - k):
+            for i in range(max(span - k + 1, 0), min(span + 1, nplusc - k)):
                 d = ((t - knots[i]) * nbasis[i]) / (knots[i + k - 1] - knots[i]) if nbasis[i] != 0. else 0.
                 e = ((knots[i + k] - t) * nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if nbasis[i + 1] != 0. else 0.
                 nbasis[i] = d + e
@@ -756,10 +762,13 @@ class BSpline:
         if isclose(t, self.max_t):
             t = self.max_t
 
-        p = Vector()
+        x = y = z = 0.
         for control_point, basis in zip(self.control_points, self.basis_values(t)):
-            p += control_point * basis
-        return p
+            if basis:
+                x += control_point.x * basis
+                y += control_point.y * basis
+                z += control_point.z * basis
+        return Vector(x, y, z)
 
     def insert_knot(self, t: float) -> None:
         """
@@ -2,7 +2,6 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
 
-from functools import partial
 import math
 from abc import abstractmethod
 
@@ -102,20 +101,16 @@ def normalize_angle(angle: float) -> float:
     Returns normalized angle between ``0`` and ``2*pi``.
 
     """
-    angle = math.fmod(angle, DOUBLE_PI)
-    if angle < 0:
-        angle += DOUBLE_PI
-    return angle
+    # Python's modulo operator returns always a positive result for a positive divisor
+    return angle % DOUBLE_PI
 
 
 def enclosing_angles(angle, start_angle, end_angle, ccw=True, abs_tol=TOLERANCE):
-    isclose = partial(math.isclose, abs_tol=abs_tol)
-
-    s = normalize_angle(start_angle)
-    e = normalize_angle(end_angle)
-    a = normalize_angle(angle)
-    if isclose(s, e):
-        return isclose(s, a)
+    s = start_angle % DOUBLE_PI
+    e = end_angle % DOUBLE_PI
+    a = angle % DOUBLE_PI
+    if math.isclose(s, e, abs_tol=abs_tol):
+        return math.isclose(s, a, abs_tol=abs_tol)
 
     if s < e:
         r = s < a < e
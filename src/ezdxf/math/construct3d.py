@@ -73,6 +73,26 @@ def normal_vector_3p(a: Vector, b: Vector, c: Vector) -> Vector:
     return (b - a).cross(c - a).normalize()
 
 
+def distance_point_line_segment_3d(point: Vector, start: Vector, end: Vector) -> float:
+    """ Returns distance from `point` to the line segment from `start` to `end` point, the distance to the nearer
+    end point is returned, if the projection of `point` is outside of the line segment.
+
+    .. versionadded:: 0.11.1
+
+    """
+    direction = end - start
+    v = point - start
+    length2 = direction.magnitude_square
+    if length2 == 0.:
+        return v.magnitude
+    t = v.dot(direction) / length2
+    if t <= 0.:
+        return v.magnitude
+    if t >= 1.:
+        return point.distance(end)
+    return v.cross(direction).magnitude / math.sqrt(length2)
+
+
 def intersection_ray_ray_3d(ray1: Tuple[Vector, Vector], ray2: Tuple[Vector, Vector], abs_tol=1e-12) -> Sequence[
     Vector]:
     """
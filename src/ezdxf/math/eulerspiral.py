@@ -1,6 +1,6 @@
 # Created: 26.03.2010
 # License: MIT License
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 from ezdxf.math import Vector
 from ezdxf.math.bspline import bspline_control_frame, BSpline
 
@@ -19,8 +19,17 @@ class EulerSpiral:
     def __init__(self, curvature: float = 1.0):
         self.curvature = curvature  # Radius of curvature
         self.curvature_powers = [curvature ** power for power in range(19)]
+        # coefficients of the series expansion as polynomials in t^4:
+        # x = t * (x0 + x1 * t^4 + x2 * t^8 + ...) and y = t^3 * (y0 + y1 * t^4 + y2 * t^8 + ...)
+        self._x_coefficients = self._coefficients([(0, 1.), (4, -40.), (8, 3456.), (12, -599040.), (16, 175472640.)])
+        self._y_coefficients = self._coefficients(
+            [(2, 6.), (6, -336.), (10, 42240.), (14, -9676800.), (18, 3530096640.)])
         self._cache = {}  # type: Dict[float, Vector] # coordinates cache
 
+    def _coefficients(self, terms: Iterable[Tuple[int, float]]) -> Tuple[float, ...]:
+        # reversed order for Horner's method
+        return tuple(1. / (const * self.curvature_powers[power]) for power, const in reversed(list(terms)))
+
     def radius(self, t: float) -> float:
         """
         Get radius of circle at distance `t`.
@@ -51,17 +60,21 @@ class EulerSpiral:
         Get point at distance `t` as :class.`Vector`.
 
         """
-
-        def term(length_power, curvature_power, const):
-            return t ** length_power / (const * self.curvature_powers[curvature_power])
-
-        if t not in self._cache:
-            y = term(3, 2, 6.) - term(7, 6, 336.) + term(11, 10, 42240.) - \
-                term(15, 14, 9676800.) + term(19, 18, 3530096640.)
-            x = t - term(5, 4, 40.) + term(9, 8, 3456.) - term(13, 12, 599040.) + \
-                term(17, 16, 175472640.)
-            self._cache[t] = Vector(x, y)
-        return self._cache[t]
+        point = self._cache.get(t)
+        if point is None:
+            point = self._point(t)
+        return point
+
+    def _point(self, t: float) -> Vector:
+        # evaluate the series expansion by Horner's method and store the result in the coordinates cache
+        x4, x3, x2, x1, x0 = self._x_coefficients
+        y4, y3, y2, y1, y0 = self._y_coefficients
+        t4 = t * t * t * t
+        x = ((((x4 * t4 + x3) * t4 + x2) * t4 + x1) * t4 + x0) * t
+        y = ((((y4 * t4 + y3) * t4 + y2) * t4 + y1) * t4 + y0) * t * t * t
+        point = Vector(x, y)
+        self._cache[t] = point
+        return point
 
     def approximate(self, length: float, segments: int) -> Iterable[Vector]:
         """
@@ -71,9 +84,15 @@ class EulerSpiral:
 
         """
         delta_l = float(length) / float(segments)
+        cache = self._cache
+        calculate_point = self._point
         yield Vector(0, 0)
         for index in range(1, segments + 1):
-            yield self.point(delta_l * index)
+            t = delta_l * index
+            point = cache.get(t)
+            if point is None:
+                point = calculate_point(t)
+            yield point
 
     def circle_center(self, t: float) -> Vector:
         """
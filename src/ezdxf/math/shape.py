@@ -59,12 +59,22 @@ class Shape2d(ConstructionTool):
 
     def rotate_rad(self, angle: float, center: 'Vertex' = None) -> None:
         """ Rotate shape around rotation `center` about `angle` in radians. """
-        if center is not None:
+        if center is None:
+            cx = cy = 0.
+        else:
             center = Vec2(center)
-            self.translate(-center)  # faster than a Matrix44 multiplication
-        self.vertices = [v.rotate(angle) for v in self.vertices]
-        if center is not None:
-            self.translate(center)  # faster than a Matrix44 multiplication
+            cx = center.x
+            cy = center.y
+        # fused translation to origin, rotation and translation back to center, single pass and sin() and cos()
+        # calculated just once, faster than a Matrix44 multiplication
+        c = math.cos(angle)
+        s = math.sin(angle)
+        vertices = []
+        for v in self.vertices:
+            x = v.x - cx
+            y = v.y - cy
+            vertices.append(Vec2(cx + x * c - y * s, cy + x * s + y * c))
+        self.vertices = vertices
 
     def offset(self, offset: float, closed: bool = False) -> 'Shape2d':
         """
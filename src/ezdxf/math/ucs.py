@@ -62,8 +62,13 @@ class OCS:
 
     def points_from_wcs(self, points: Iterable['Vertex']) -> Iterable['Vertex']:
         """ Returns iterable of OCS vectors from WCS `points`. """
-        for point in points:
-            yield self.from_wcs(point)
+        # test loop invariant transformation state only once
+        if self.transform:
+            transform = self.transpose.transform
+            for point in points:
+                yield transform(point)
+        else:
+            yield from points
 
     def to_wcs(self, point: 'Vertex') -> 'Vertex':
         """ Returns WCS vector for OCS `point`. """
@@ -74,8 +79,13 @@ class OCS:
 
     def points_to_wcs(self, points: Iterable['Vertex']) -> Iterable['Vertex']:
         """ Returns iterable of WCS vectors for OCS `points`. """
-        for point in points:
-            yield self.to_wcs(point)
+        # test loop invariant transformation state only once
+        if self.transform:
+            transform = self.matrix.transform
+            for point in points:
+                yield transform(point)
+        else:
+            yield from points
 
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
@@ -3,15 +3,22 @@
 # Copyright (c) 2010-2018, Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Iterable, List, Tuple, Optional
+import math
+from operator import itemgetter, attrgetter
+from itertools import chain
+import logging
 from ezdxf.math.vector import Vector
 from ezdxf.math.bspline import bspline_control_frame
 from ezdxf.math.bspline import BSpline, BSplineU, BSplineClosed
-from ezdxf.math.bezier4p import Bezier4P
 from ezdxf.math.eulerspiral import EulerSpiral as _EulerSpiral
+from ezdxf.math.bezier4p import Bezier4P
+from ezdxf.math.construct3d import distance_point_line_segment_3d
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex, BaseLayout, Matrix44
 
+logger = logging.getLogger('ezdxf')
+
 
 class Bezier:
     """
@@ -25,26 +32,34 @@ class Bezier:
 
     class Segment:
         def __init__(self, start: 'Vertex', end: 'Vertex', start_tangent: 'Vertex', end_tangent: 'Vertex',
-                     segments: int):
+                     segments: int, tolerance: float = None):
             self.start = Vector(start)
             self.end = Vector(end)
             self.start_tangent = Vector(start_tangent)  # as vector, from start point
             self.end_tangent = Vector(end_tangent)  # as vector, from end point
-            self.segments = segments
-
-        def approximate(self) -> Iterable[Vector]:
-            control_points = [
+            self.tolerance = tolerance  # max. distance of approximation to curve, None for fixed segment count
+            self.control_points = [
                 self.start,
                 self.start + self.start_tangent,
                 self.end + self.end_tangent,
                 self.end,
             ]
-            bezier = Bezier4P(control_points)
-            return bezier.approximate(self.segments)
+            # effective count of line segments for approximation: the given fixed count if tolerance is None,
+            # else the count required by the tolerance, argument `segments` is ignored in this case
+            if tolerance is None:
+                self.segments = segments
+            else:
+                self.segments = flattening_count(self.control_points, tolerance)
+
+        def approximate(self) -> Iterable[Tuple[float, float, float]]:
+            """ Yields `segments` + 1 vertices as ``(x, y, z)`` tuples. """
+            if self.tolerance is None:
+                return Bezier4P(self.control_points).approximate(self.segments)
+            return forward_differences(self.control_points, self.segments)
 
     def __init__(self):
-        # fit point, first control vector, second control vector, segment count
-        self.points = []  # type: List[Tuple[Vector, Optional[Vector], Optional[Vector], Optional[int]]]
+        # fit point, first control vector, second control vector, segment count, tolerance
+        self.points = []  # type: List[Tuple[Vector, Optional[Vector], Optional[Vector], Optional[int], Optional[float]]]
 
     def start(self, point: 'Vertex', tangent: 'Vertex') -> None:
         """
@@ -55,9 +70,10 @@ class Bezier:
             tangent: start tangent as vector, example: ``(5, 0, 0)`` means a
                      horizontal tangent with a length of 5 drawing units
         """
-        self.points.append((point, None, tangent, None))
+        self.points.append((point, None, tangent, None, None))
 
-    def append(self, point: 'Vertex', tangent1: 'Vertex', tangent2: 'Vertex' = None, segments: int = 20):
+    def append(self, point: 'Vertex', tangent1: 'Vertex', tangent2: 'Vertex' = None, segments: int = 20,
+               tolerance: float = None):
         """
         Append a control point with two control tangents.
 
@@ -67,6 +83,15 @@ class Bezier:
             tangent2: second control tangent as vector "right" of control point, if omitted `tangent2` = `-tangent1`
             segments: count of line segments for polyline approximation, count of line segments from previous
                       control point to appended control point.
+            tolerance: max. distance of the polyline approximation to the curve from previous control point to
+                       appended control point, the segment count is determined by the curvature and
+                       `segments` is ignored, ``None`` for a fixed segment count. The segment count is limited to
+                       1024, for large curves and very small tolerances the max. distance can exceed `tolerance`,
+                       a warning is logged in this case.
+
+        .. versionchanged:: 0.11.1
+
+            argument `tolerance`
 
         """
         tangent1 = Vector(tangent1)
@@ -74,7 +99,11 @@ class Bezier:
             tangent2 = -tangent1
         else:
             tangent2 = Vector(tangent2)
-        self.points.append((point, tangent1, tangent2, int(segments)))
+        if tolerance is not None:
+            tolerance = float(tolerance)
+            if tolerance <= 0.:
+                raise ValueError('Argument tolerance has to be > 0.')
+        self.points.append((point, tangent1, tangent2, int(segments), tolerance))
 
     def _build_bezier_segments(self) -> Iterable[Segment]:
         if len(self.points) > 1:
@@ -84,8 +113,9 @@ class Bezier:
                 end_point = to_point[0]
                 end_tangent = to_point[1]  # tangent1
                 count = to_point[3]
+                tolerance = to_point[4]
                 yield Bezier.Segment(start_point, end_point,
-                                     start_tangent, end_tangent, count)
+                                     start_tangent, end_tangent, count, tolerance)
         else:
             raise ValueError('Two or more points needed!')
 
@@ -99,15 +129,80 @@ class Bezier:
             dxfattribs: DXF attributes for :class:`~ezdxf.entities.Polyline`
 
         """
-        points = []
-        for segment in self._build_bezier_segments():
-            points.extend(segment.approximate())
-        if force3d or any(p[2] for p in points):
+        points = list(chain.from_iterable(segment.approximate() for segment in self._build_bezier_segments()))
+        if force3d or any(map(itemgetter(2), points)):
             layout.add_polyline3d(points, dxfattribs=dxfattribs)
         else:
             layout.add_polyline2d(points, dxfattribs=dxfattribs)
 
 
+MAX_FLATTENING_COUNT = 1024
+
+
+def flattening_count(control_points: List[Vector], tolerance: float) -> int:
+    """
+    Returns the required count of uniform line segments to approximate a cubic bezier curve with a max. distance of
+    `tolerance` to the curve (Wang's formula), calculated up front from the second differences of the control points
+    instead of an iterative subdivision::
+
+        N = ceil(sqrt(3/4 * max(|P0 - 2*P1 + P2|, |P1 - 2*P2 + P3|) / tolerance))
+
+    Returns 1 for a straight curve, where both inner control points are closer than `tolerance` to the chord from
+    start- to end point, by the convex hull property the whole curve is closer than `tolerance` to the chord.
+
+    The result is limited to `MAX_FLATTENING_COUNT`, if the limit is hit, the `tolerance` is not guaranteed
+    and a warning is logged.
+
+    """
+    p0, p1, p2, p3 = control_points
+    if distance_point_line_segment_3d(p1, p0, p3) < tolerance and \
+            distance_point_line_segment_3d(p2, p0, p3) < tolerance:
+        return 1
+    d = max((p0 - 2. * p1 + p2).magnitude, (p1 - 2. * p2 + p3).magnitude)
+    count = math.ceil(math.sqrt(.75 * d / tolerance))
+    if count > MAX_FLATTENING_COUNT:
+        logger.warning('Bezier flattening requires {} segments for tolerance {}, limited to {} segments.'.format(
+            count, tolerance, MAX_FLATTENING_COUNT))
+        return MAX_FLATTENING_COUNT
+    return max(count, 1)
+
+
+def forward_differences(control_points: List[Vector], count: int) -> Iterable[Tuple[float, float, float]]:
+    """
+    Approximate a cubic bezier curve by `count` uniform line segments, yields `count` + 1 vertices as
+    ``(x, y, z)`` tuples.
+
+    The curve is evaluated by forward differencing of the power basis form, each vertex costs only additions instead
+    of a full evaluation of the Bernstein polynomials. Start- and end point are the exact control points.
+
+    """
+    p0, p1, p2, p3 = control_points
+    h = 1. / count
+    h2 = h * h
+    h3 = h2 * h
+    # power basis: f(t) = a*t^3 + b*t^2 + c*t + p0
+    a = (p3 - p0) + 3. * (p1 - p2)
+    b = 3. * (p0 - 2. * p1 + p2)
+    c = 3. * (p1 - p0)
+    fx, fy, fz = p0
+    d1x, d1y, d1z = a * h3 + b * h2 + c * h
+    d2x, d2y, d2z = a * (6. * h3) + b * (2. * h2)
+    d3x, d3y, d3z = a * (6. * h3)
+    yield p0.xyz
+    for _ in range(1, count):
+        fx += d1x
+        fy += d1y
+        fz += d1z
+        d1x += d2x
+        d1y += d2y
+        d1z += d2z
+        d2x += d3x
+        d2y += d3y
+        d2z += d3z
+        yield fx, fy, fz
+    yield p3.xyz
+
+
 class Spline:
     def __init__(self, points: Iterable['Vertex'] = None, segments: int = 100):
         """
@@ -150,7 +245,7 @@ class Spline:
         """
         spline = bspline_control_frame(self.points, degree=degree, method=method, power=power)
         vertices = list(spline.approximate(self.segments))
-        if any(vertex.z != 0. for vertex in vertices):
+        if any(map(attrgetter('z'), vertices)):
             layout.add_polyline3d(vertices, dxfattribs=dxfattribs)
         else:
             layout.add_polyline2d(vertices, dxfattribs=dxfattribs)
@@ -279,8 +374,8 @@ class EulerSpiral:
         """
         points = self.spiral.approximate(length, segments)
         if matrix is not None:
-            points = matrix.transform_vectors(points)
-        return layout.add_polyline3d(list(points), dxfattribs=dxfattribs)
+            points = matrix.transform_vectors(points)  # returns a list, no further materialization required
+        return layout.add_polyline3d(points, dxfattribs=dxfattribs)
 
     def render_spline(self, layout: 'BaseLayout', length: float = 1, fit_points: int = 10, degree: int = 3,
                       matrix: 'Matrix44' = None, dxfattribs: dict = None):
@@ -32,12 +32,15 @@ def circle(count: int, radius: float = 1, elevation: float = 0, close: bool = Fa
     """
     radius = float(radius)
     delta = 2. * pi / count
-    alpha = 0.
+    # uniform angle steps: cos() and sin() of the next angle by rotation of the previous (cos, sin) vector about
+    # the constant step angle, no cos() and sin() calls for each vertex
+    cd = cos(delta)
+    sd = sin(delta)
+    u = 1.  # cos(0)
+    v = 0.  # sin(0)
     for index in range(count):
-        x = cos(alpha) * radius
-        y = sin(alpha) * radius
-        yield Vector(x, y, elevation)
-        alpha += delta
+        yield Vector(u * radius, v * radius, elevation)
+        u, v = cd * u - sd * v, sd * u + cd * v
 
     if close:
         yield Vector(radius, 0, elevation)
@@ -68,9 +71,15 @@ def ellipse(count: int, rx: float = 1, ry: float = 1, start_param: float = 0, en
     end_param = float(end_param)
     count = int(count)
     delta = (end_param - start_param) / (count - 1)
+    # uniform param steps: cos() and sin() of the next param by rotation of the previous (cos, sin) vector about
+    # the constant step angle, no cos() and sin() calls for each vertex
+    cd = cos(delta)
+    sd = sin(delta)
+    u = cos(start_param)
+    v = sin(start_param)
     for param in range(count):
-        alpha = start_param + param * delta
-        yield Vector(cos(alpha) * rx, sin(alpha) * ry, elevation)
+        yield Vector(u * rx, v * ry, elevation)
+        u, v = cd * u - sd * v, sd * u + cd * v
 
 
 def euler_spiral(count: int, length: float = 1, curvature: float = 1, elevation: float = 0) -> Iterable[Vector]:
@@ -353,9 +362,13 @@ def rotate(vertices: Iterable['Vertex'], angle: 0., deg: bool = True) -> Iterabl
 
     """
     if deg:
-        return (Vector(v).rotate_deg(angle) for v in vertices)
-    else:
-        return (Vector(v).rotate(angle) for v in vertices)
+        angle = radians(angle)
+    # rotation angle is loop invariant, calculate sin() and cos() just once
+    c = cos(angle)
+    s = sin(angle)
+    for v in vertices:
+        x, y, z = Vector(v)
+        yield Vector(x * c - y * s, x * s + y * c, z)
 
 
 def scale(vertices: Iterable['Vertex'], scaling=(1., 1., 1.)) -> Iterable[Vector]:
@@ -14,6 +14,12 @@ def test_normalize_angle():
     assert isclose(normalize_angle(huge_angle), 2.)
 
 
+def test_normalize_negative_angle():
+    assert isclose(normalize_angle(-HALF_PI), THREE_PI_HALF)
+    assert isclose(normalize_angle(-2 - 16 * HALF_PI), DOUBLE_PI - 2.)
+    assert normalize_angle(-DOUBLE_PI) == 0.
+
+
 def test_left_of_line():
     assert is_point_left_of_line(Vec2(-1, 0), Vec2(0, 0), Vec2(0.1, 1)) is True
     assert is_point_left_of_line(Vec2(1, 0), Vec2(0, 0), Vec2(0, -1)) is True
@@ -3,6 +3,7 @@
 import pytest
 
 from ezdxf.math import is_planar_face, Vector, Vec2, subdivide_face, intersection_ray_ray_3d, normal_vector_3p
+from ezdxf.math import distance_point_line_segment_3d
 from ezdxf.math import X_AXIS, Y_AXIS, Z_AXIS
 from ezdxf.render.forms import square
 
@@ -94,5 +95,17 @@ def test_normal_vector_for_3_points():
     assert normal_vector_3p(o, Z_AXIS, Y_AXIS) == -X_AXIS
 
 
+def test_distance_point_line_segment_3d():
+    start = Vector(0, 0, 1)
+    end = Vector(10, 0, 1)
+    assert distance_point_line_segment_3d(Vector(5, 3, 1), start, end) == 3
+    assert distance_point_line_segment_3d(Vector(5, 0, 5), start, end) == 4
+    # projection outside of the line segment
+    assert distance_point_line_segment_3d(Vector(-3, 4, 1), start, end) == 5
+    assert distance_point_line_segment_3d(Vector(13, 4, 1), start, end) == 5
+    # degenerated line segment
+    assert distance_point_line_segment_3d(Vector(3, 4, 1), start, start) == 5
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -57,3 +57,9 @@ def test_as_bspline():
     results = spline.approximate(10)
     for expected, result in zip(expected_points, results):
         assert is_close_points(Vector(expected), result)
+
+
+def test_point():
+    spiral = EulerSpiral(2.0)
+    for index, expected in enumerate(expected_points):
+        assert is_close_points(Vector(expected), spiral.point(index * .5))
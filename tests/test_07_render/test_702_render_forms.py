@@ -1,6 +1,7 @@
 # Copyright (c) 2018-2020 Manfred Moitzi
 # License: MIT License
-from ezdxf.render.forms import circle, close_polygon, cube, extrude, cylinder, cone, square, box, ngon
+import math
+from ezdxf.render.forms import circle, ellipse, close_polygon, cube, extrude, cylinder, cone, square, box, ngon
 from ezdxf.render.forms import open_arrow, arrow2
 from ezdxf.render.forms import spline_interpolation, spline_interpolated_profiles
 from ezdxf.render.forms import from_profiles_linear, from_profiles_spline
@@ -19,6 +20,20 @@ def test_circle_closed():
     assert len(c) == 9
 
 
+def test_circle_vertices():
+    for index, v in enumerate(circle(100, radius=2, elevation=1)):
+        angle = math.pi * 2 * index / 100
+        assert v.isclose(Vector(math.cos(angle) * 2, math.sin(angle) * 2, 1))
+
+
+def test_ellipse():
+    e = list(ellipse(101, rx=3, ry=2, start_param=.5, end_param=5, elevation=1))
+    assert len(e) == 101
+    for index, v in enumerate(e):
+        param = .5 + 4.5 * index / 100
+        assert v.isclose(Vector(math.cos(param) * 3, math.sin(param) * 2, 1))
+
+
 def test_close_polygon():
     p = list(close_polygon([(1, 0), (2, 0), (3, 0), (4, 0)]))
     assert len(p) == 5
@@ -165,6 +180,14 @@ def test_rotate():
     assert is_close_points(r[1], (-1, 0, 6))
 
 
+def test_rotate_radians():
+    p = [(1, 0, 3), (0, 1, 6), (2, 2, 0)]
+    r = list(rotate(p, math.pi / 2, deg=False))
+    assert is_close_points(r[0], (0, 1, 3))
+    assert is_close_points(r[1], (-1, 0, 6))
+    assert is_close_points(r[2], (-2, 2, 0))
+
+
 def test_square_by_radius():
     corners = list(ngon(4, radius=1))
     assert len(corners) == 4
@@ -0,0 +1,184 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+import ezdxf
+from ezdxf.math import Vector, Matrix44, distance_point_line_segment_3d
+from ezdxf.math.bezier4p import Bezier4P, bernstein_basis, MAX_CACHED_BASIS_COUNT, _cached_bernstein_basis
+from ezdxf.render.curves import Bezier, EulerSpiral, flattening_count, forward_differences
+from ezdxf.render.curves import MAX_FLATTENING_COUNT
+
+
+def max_deviation(segment: Bezier.Segment, vertices) -> float:
+    curve = Bezier4P([
+        segment.start,
+        segment.start + segment.start_tangent,
+        segment.end + segment.end_tangent,
+        segment.end,
+    ])
+    polyline = list(zip(vertices[:-1], vertices[1:]))
+    return max(
+        min(distance_point_line_segment_3d(Vector(p), s, e) for s, e in polyline)
+        for p in curve.approximate(200)
+    )
+
+
+def test_fixed_segment_count():
+    bezier = Bezier()
+    bezier.start((0, 0), tangent=(1, 2))
+    bezier.append((10, 0), tangent1=(-1, 2), segments=7)
+    segment = list(bezier._build_bezier_segments())[0]
+    assert len(list(segment.approximate())) == 8
+
+
+def test_invalid_tolerance():
+    bezier = Bezier()
+    with pytest.raises(ValueError):
+        bezier.append((10, 0), tangent1=(-1, 2), tolerance=0)
+
+
+@pytest.mark.parametrize('tolerance', [1, .1, .01])
+def test_adaptive_approximation_tolerance(tolerance):
+    bezier = Bezier()
+    bezier.start((0, 0, 0), tangent=(0, 5, 0))
+    bezier.append((10, 0, 2), tangent1=(0, 5, 0), tolerance=tolerance)
+    segment = list(bezier._build_bezier_segments())[0]
+    vertices = [Vector(v) for v in segment.approximate()]
+    assert vertices[0].isclose(segment.start)
+    assert vertices[-1].isclose(segment.end)
+    assert max_deviation(segment, vertices) <= tolerance
+
+
+def test_adaptive_approximation_adapts_to_curvature():
+    bezier = Bezier()
+    bezier.start((0, 0), tangent=(1, .1))
+    bezier.append((10, 0), tangent1=(-1, .1), tolerance=.1)
+    bezier.append((20, 0), tangent1=(0, -10), tolerance=.1)
+    flat, curved = [list(segment.approximate()) for segment in bezier._build_bezier_segments()]
+    assert len(flat) < len(curved)
+
+
+def test_flattening_count():
+    line = Vector.list([(0, 0), (1, 0), (2, 0), (3, 0)])
+    assert flattening_count(line, .01) == 1
+    arc = Vector.list([(0, 0), (0, 4), (10, 4), (10, 0)])
+    # 3/4 * |(0, 0) - 2*(0, 4) + (10, 4)| = 3/4 * sqrt(116)
+    assert flattening_count(arc, 1) == 3
+    assert flattening_count(arc, .01) == 29
+
+
+def test_flattening_count_is_limited(caplog):
+    control_points = Vector.list([(0, 0), (0, 1000), (1000, 1000), (1000, 0)])
+    assert flattening_count(control_points, 1e-4) == MAX_FLATTENING_COUNT
+    assert 'limited to 1024 segments' in caplog.text
+    # max. distance exceeds the tolerance
+    bezier = Bezier()
+    bezier.start((0, 0), tangent=(0, 1000))
+    bezier.append((1000, 0), tangent1=(0, 1000), tolerance=1e-4)
+    segment = list(bezier._build_bezier_segments())[0]
+    vertices = [Vector(v) for v in segment.approximate()]
+    assert len(vertices) == MAX_FLATTENING_COUNT + 1
+    assert max_deviation(segment, vertices) > 1e-4
+
+
+def test_flattening_count_of_straight_curves():
+    # uneven spaced inner control points
+    line = Vector.list([(0, 0), (7, 0), (8, 0), (10, 0)])
+    assert flattening_count(line, .01) == 1
+    # inner control points beyond the end point
+    overshoot = Vector.list([(0, 0), (1, 0), (20, 0), (10, 0)])
+    assert flattening_count(overshoot, .01) > 1
+    almost = Vector.list([(0, 0), (3, .001), (7, -.001), (10, 0)])
+    assert flattening_count(almost, .01) == 1
+
+
+def test_forward_differences():
+    control_points = Vector.list([(0, 0, 0), (0, 4, 1), (10, 4, 2), (10, 0, 3)])
+    expected = list(Bezier4P(control_points).approximate(50))
+    result = list(forward_differences(control_points, 50))
+    assert len(result) == 51
+    assert result[0] == (0, 0, 0)
+    assert result[-1] == (10, 0, 3)
+    for e, r in zip(expected, result):
+        assert Vector(r).isclose(e, abs_tol=1e-9)
+
+
+def test_render_2d():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    bezier = Bezier()
+    bezier.start((0, 0), tangent=(1, 2))
+    bezier.append((10, 0), tangent1=(-1, 2), segments=10)
+    bezier.append((20, 0), tangent1=(-1, -2), segments=5)
+    bezier.render(msp)
+    polyline = msp.query('POLYLINE')[0]
+    assert polyline.is_2d_polyline
+    # each segment yields its start- and end point
+    assert len(polyline) == 17
+    points = list(polyline.points())
+    assert points[10] == (10, 0, 0)
+    assert points[11] == (10, 0, 0)
+    assert points[-1] == (20, 0, 0)
+
+
+def test_render_3d():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    bezier = Bezier()
+    bezier.start((0, 0, 0), tangent=(1, 2, 0))
+    bezier.append((10, 0, 1), tangent1=(-1, 2, 0), tolerance=.1)
+    bezier.render(msp)
+    polyline = msp.query('POLYLINE')[0]
+    assert polyline.is_3d_polyline
+    assert list(polyline.points())[-1] == (10, 0, 1)
+
+
+@pytest.mark.parametrize('matrix', [None, Matrix44.translate(1, 2, 3)])
+def test_render_euler_spiral_as_polyline(matrix):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    polyline = EulerSpiral(2).render_polyline(msp, length=5, segments=10, matrix=matrix)
+    assert len(polyline) == 11
+    start = Vector(0, 0, 0) if matrix is None else Vector(1, 2, 3)
+    assert list(polyline.points())[0] == start
+
+
+def test_segment_approximation_by_bernstein_basis():
+    bezier = Bezier()
+    bezier.start((0, 0, 0), tangent=(0, 4, 1))
+    bezier.append((10, 0, 3), tangent1=(0, 4, 1), segments=20)
+    segment = list(bezier._build_bezier_segments())[0]
+    expected = list(Bezier4P(segment.control_points).approximate(20))
+    result = list(segment.approximate())
+    assert len(result) == 21
+    assert result[0] == (0, 0, 0)
+    assert result[-1] == (10, 0, 3)
+    assert result == expected
+
+
+def test_segment_count_of_tolerance_based_segment():
+    bezier = Bezier()
+    bezier.start((0, 0), tangent=(0, 4))
+    bezier.append((10, 0), tangent1=(0, 4), segments=7, tolerance=1)
+    segment = list(bezier._build_bezier_segments())[0]
+    assert segment.segments == 3
+    assert len(list(segment.approximate())) == 4
+
+
+@pytest.mark.parametrize('count', [MAX_CACHED_BASIS_COUNT, MAX_CACHED_BASIS_COUNT + 1])
+def test_bernstein_basis(count):
+    basis = list(bernstein_basis(count))
+    assert len(basis) == count + 1
+    assert basis[0] == (1, 0, 0, 0)
+    assert basis[-1] == (0, 0, 0, 1)
+    for b in basis:
+        assert math.isclose(sum(b), 1)
+
+
+def test_bernstein_basis_cache_is_limited():
+    _cached_bernstein_basis.cache_clear()
+    list(bernstein_basis(MAX_CACHED_BASIS_COUNT))
+    list(bernstein_basis(MAX_CACHED_BASIS_COUNT + 1))
+    info = _cached_bernstein_basis.cache_info()
+    assert info.currsize == 1
+    assert info.maxsize == MAX_CACHED_BASIS_COUNT